@@ -9,23 +9,20 @@
 """  # noqa: D205,D208,D400
 import os
 import re
-import shutil
+import sys
 
 from datetime import date
 from importlib.util import find_spec
 from pathlib import Path
-from typing import List
-
-import sphinx_rtd_theme  # type: ignore[import]
+from typing import Any, Dict, List
 
 from sphinx.application import Sphinx
 
-from python_test_cielquan import (  # CHANGE ME
-    __author__,
-    __gh_repository_link__,
-    __project__,
-    __version__,
-)
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
 
 needs_sphinx = "3.1"  #: Minimum Sphinx version to build the docs
@@ -36,15 +33,43 @@ NOT_LOADED_MSGS = []
 
 
 #: -- PROJECT INFORMATION --------------------------------------------------------------
-project = __project__.replace("-", "_")
-author = __author__
+def _read_poetry_config() -> Dict[str, Any]:
+    """Read the project's metadata from pyproject.toml w/o importing the package."""
+    with open(Path("../../pyproject.toml"), "rb") as pyproject_file:
+        pyproject: Dict[str, Any] = tomllib.load(pyproject_file)
+    return pyproject["tool"]["poetry"]  # type: ignore[no-any-return]
+
+
+def _get_gh_repo_link(urls: Dict[str, str]) -> str:
+    """Search for and return a link to the Github repo."""
+    for cat in ("Github", "Repository", "Source", "Code", "Homepage"):
+        if cat in urls:
+            return urls[cat].rstrip("/")
+    raise AttributeError("pyproject.toml does not contain a link to source code.")
+
+
+POETRY_CONFIG = _read_poetry_config()
+#: Same links as poetry puts into the package's `Project-URL` metadata
+GH_REPOSITORY_LINK = _get_gh_repo_link(
+    {
+        **{
+            cat: POETRY_CONFIG[key]
+            for cat, key in (("Homepage", "homepage"), ("Repository", "repository"))
+            if POETRY_CONFIG.get(key)
+        },
+        **POETRY_CONFIG.get("urls", {}),
+    }
+)
+
+project = POETRY_CONFIG["name"].replace("-", "_")
+author = re.sub(r"\s*<.*>$", "", POETRY_CONFIG["authors"][0])
 CREATION_YEAR = 2019  # CHANGE ME
 CURRENT_YEAR = f"{date.today().year}"
 copyright = (  # noqa: VNE003,W0622
     f"{CREATION_YEAR}{('-' + CURRENT_YEAR) if CURRENT_YEAR != CREATION_YEAR else ''}, "
     + f"{author} and AUTHORS"
 )
-release = __version__  #: The full version, including alpha/beta/rc tags
+release = POETRY_CONFIG["version"]  #: The full version, including alpha/beta/rc tags
 version_parts = re.search(
     r"^v?(?P<version>\d+\.\d+)\.\d+[-.]?(?P<tag>[a-z]*)[\.]?\d*", release
 )
@@ -59,9 +84,10 @@ extensions: List[str] = []
 today_fmt = "%Y-%m-%d"
 exclude_patterns: List[str] = []  #: Files to exclude for source of doc
 
-#: Added dirs for static and template files if they exist
-html_static_path = ["_static"] if Path("_static").exists() else []
-templates_path = ["_templates"] if Path("_templates").exists() else []
+#: Added dirs for static and template files if they exist (one dir scan for both)
+CONF_DIR_ENTRIES = {entry.name for entry in os.scandir(".") if entry.is_dir()}
+html_static_path = ["_static"] if "_static" in CONF_DIR_ENTRIES else []
+templates_path = ["_templates"] if "_templates" in CONF_DIR_ENTRIES else []
 
 rst_prolog = """
 .. ifconfig:: RELEASE_LEVEL in ('alpha', 'beta', 'rc')
@@ -116,63 +142,35 @@ intersphinx_mapping = {"python": ("https://docs.python.org/3/", None)}
 
 extensions.append("sphinx.ext.extlinks")
 extlinks = {
-    "repo": (f"{__gh_repository_link__}/%s", "Repo's "),
-    "issue": (f"{__gh_repository_link__}/issues/%s", "#"),
-    "pull": (f"{__gh_repository_link__}/pull/%s", "pr"),
+    "repo": (f"{GH_REPOSITORY_LINK}/%s", "Repo's "),
+    "issue": (f"{GH_REPOSITORY_LINK}/issues/%s", "#"),
+    "pull": (f"{GH_REPOSITORY_LINK}/pull/%s", "pr"),
     "user": ("https://github.com/%s", "@"),
 }
 
 
-#: -- APIDOC ---------------------------------------------------------------------------
-apidoc_module_dir = f"../../src/{project}/"
-apidoc_output_dir = "autoapidoc"
-apidoc_toc_file = False
-apidoc_separate_modules = False
-apidoc_module_first = True
-apidoc_extra_args = []
-if Path("_apidoc_templates").is_dir():
-    apidoc_extra_args += ["--templatedir", "apidoc_templates"]
-autoclass_content = "both"
-
-
-if find_spec("sphinxcontrib.apidoc") is not None:
-    extensions.append("sphinxcontrib.apidoc")
-    if Path(apidoc_output_dir).is_dir():
-        shutil.rmtree(apidoc_output_dir)
-else:
-    NOT_LOADED_MSGS.append(
-        "## 'sphinxcontrib-apidoc' extension not loaded - not installed"
-    )
-
-
-#: -- AUTODOC --------------------------------------------------------------------------
-extensions.append("sphinx.ext.autodoc")
+#: -- AUTOAPI --------------------------------------------------------------------------
+#: needs install: "sphinx-autoapi"
+#: Source files are parsed statically so the package is not imported
+extensions.append("autoapi.extension")
+autoapi_type = "python"
+autoapi_dirs = [f"../../src/{project}"]
+autoapi_root = "autoapi"
+autoapi_add_toctree_entry = False
+autoapi_member_order = "bysource"
+autoapi_options = [
+    "members",
+    "undoc-members",
+    "show-inheritance",
+    "show-module-summary",
+]
 autodoc_typehints = "description"
-autodoc_member_order = "bysource"
-autodoc_mock_imports: List[str] = []
-autodoc_default_options = {"members": True}
-
-
-def _remove_module_docstring(  # noqa: R0913
-    app, what, name, obj, options, lines  # noqa: ANN001,W0613
-) -> None:
-    """Remove module docstring."""
-    if what == "module":
-        del lines[:]
-
-
-if find_spec("sphinx_autodoc_typehints") is not None:
-    extensions.append("sphinx_autodoc_typehints")
-else:
-    NOT_LOADED_MSGS.append(
-        "## 'sphinx-autodoc-typehints' extension not loaded - not installed"
-    )
 
 
 #: -- SPELLING -------------------------------------------------------------------------
 spelling_word_list_filename = "spelling_dict.txt"
 spelling_show_suggestions = True
-spelling_exclude_patterns = ["autoapi/**", "autoapidoc/**"]
+spelling_exclude_patterns = ["autoapi/**"]
 
 if find_spec("sphinxcontrib.spelling") is not None:
     extensions.append("sphinxcontrib.spelling")
@@ -186,7 +184,6 @@ else:
 #: needs install: "sphinx-rtd-theme"
 extensions.append("sphinx_rtd_theme")
 html_theme = "sphinx_rtd_theme"
-html_theme_path = [sphinx_rtd_theme.get_html_theme_path()]
 html_theme_options = {"style_external_links": True, "navigation_depth": 5}
 
 
@@ -198,8 +195,6 @@ html_show_sourcelink = True  #: Add links to *.rst source files on HTML pages
 #: -- FINAL SETUP ----------------------------------------------------------------------
 def setup(app: Sphinx) -> None:
     """Connect custom func to sphinx events."""
-    app.connect("autodoc-process-docstring", _remove_module_docstring)
-
     app.add_config_value("RELEASE_LEVEL", "", "env")
 
 
@@ -8,22 +8,23 @@
     :license: GPL-3.0-or-later, see LICENSE for details
 """  # noqa: D205,D208,D400
 import contextlib
+import functools
 import os
+import pickle  # noqa: S403
 import re
 import subprocess  # noqa: S404
 import sys
+import tempfile
 
 from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import nox
-import tomlkit  # type: ignore[import]
 
 from formelsammlung.nox_session import Session, session_w_poetry
 from formelsammlung.venv_utils import get_venv_bin_dir, get_venv_path, get_venv_tmp_dir
 from nox.command import CommandFailed
-from nox.logger import logger as nox_logger
 
 
 #: -- NOX OPTIONS ----------------------------------------------------------------------
@@ -34,21 +35,88 @@ nox.options.sessions = ["full_lint", "full_test_code", "full_test_docs"]
 
 #: -- UTIL -----------------------------------------------------------------------------
 OS = sys.platform
+#: Interpreter identifier like `linux.cpython3.8`
+PYTHON_ID = f"{OS}.{sys.implementation.name}{sys.version_info[0]}.{sys.version_info[1]}"
 TOX_CALLS = os.getenv("_NOX_TOX_CALLS") == "true"
 FORCE_COLOR = os.getenv("_NOX_FORCE_COLOR") == "true"
 IN_CI = os.getenv("_NOX_IN_CI") == "true"
+#: Matches a `poetry show` line: `<name> [(!)] <version> <description>`
+POETRY_SHOW_RE = re.compile(rb"([\w-]+)[ (!)]+([\d.a-z-]+).*")
 
 #: -- PATHS ----------------------------------------------------------------------------
 NOXFILE_DIR = Path(__file__).parent
+PYPROJECT_FILE = NOXFILE_DIR / "pyproject.toml"
 COV_CACHE_DIR = NOXFILE_DIR / ".coverage_cache"
+COV_DATA_FILE = COV_CACHE_DIR / ".coverage"
+COV_XML_FILE = COV_CACHE_DIR / "coverage.xml"
+COV_HTML_DIR = COV_CACHE_DIR / "htmlcov"
+JUNIT_CACHE_DIR = NOXFILE_DIR / ".junit_cache"
+DOCS_INDEX_FILE = NOXFILE_DIR / "docs" / "build" / "html" / "index.html"
+PRE_COMMIT_CONFIG = NOXFILE_DIR / ".pre-commit-config.yaml"
+PYPROJECT_CACHE_FILE = NOXFILE_DIR / ".nox" / ".noxfile_cache.pkl"
+PIP_CACHE_DIR = NOXFILE_DIR / ".cache" / "pip"
+POETRY_CACHE_DIR = NOXFILE_DIR / ".cache" / "poetry"
+
+#: Keep pip/poetry downloads in the project dir in CI so they can be cached by the CI
+if IN_CI:
+    os.environ.setdefault("PIP_CACHE_DIR", str(PIP_CACHE_DIR))
+    os.environ.setdefault("POETRY_CACHE_DIR", str(POETRY_CACHE_DIR))
+    os.environ.setdefault("PIP_PREFER_BINARY", "1")
+
 
 #: -- CONFIG FROM PYPROJECT.TOML -------------------------------------------------------
-with open(NOXFILE_DIR / "pyproject.toml") as pyproject_file:
-    PYPROJECT = tomlkit.parse(pyproject_file.read())
+#: Only the `tool` sections used by the noxfile are cached to keep the cache small
+PYPROJECT_CACHED_SECTIONS = ("poetry", "_testing")
+
+
+def _load_pyproject() -> Dict[str, Any]:
+    """Load the sections of pyproject.toml used here or their pickled cache.
+
+    The cache is keyed on the file's mtime and size and the cached sections. The TOML
+    parser is only imported when the cache is outdated.
+    """
+    pyproject_stat = PYPROJECT_FILE.stat()
+    key = (
+        pyproject_stat.st_mtime_ns,
+        pyproject_stat.st_size,
+        PYPROJECT_CACHED_SECTIONS,
+    )
+
+    with contextlib.suppress(
+        OSError, EOFError, KeyError, TypeError, ValueError, pickle.UnpicklingError
+    ):
+        cache = pickle.loads(PYPROJECT_CACHE_FILE.read_bytes())  # noqa: S301
+        if cache["key"] == key:
+            return cache["data"]  # type: ignore[no-any-return]
+
+    if sys.version_info >= (3, 11):
+        import tomllib  # noqa: C0415
+    else:
+        import tomli as tomllib  # noqa: C0415
+
+    with open(PYPROJECT_FILE, "rb") as pyproject_file:
+        tool_config = tomllib.load(pyproject_file)["tool"]
+    data = {"tool": {sec: tool_config[sec] for sec in PYPROJECT_CACHED_SECTIONS}}
+
+    #: Write to a temp file and move it so parallel nox runs never read a partial cache
+    with contextlib.suppress(OSError):
+        PYPROJECT_CACHE_FILE.parent.mkdir(exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=PYPROJECT_CACHE_FILE.parent, suffix=".tmp", delete=False
+        ) as cache_file:
+            pickle.dump({"key": key, "data": data}, cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_file.name, PYPROJECT_CACHE_FILE)
+
+    return data
+
+
+PYPROJECT = _load_pyproject()
 PACKAGE_NAME = PYPROJECT["tool"]["poetry"]["name"]
 SKIP_INSTALL = PYPROJECT["tool"]["_testing"]["skip_install"]
 TOXENV_PYTHON_VERSIONS = PYPROJECT["tool"]["_testing"][f"toxenv_python_versions_{OS}"]
 TOXENV_DOCS_BUILDERS = PYPROJECT["tool"]["_testing"]["toxenv_docs_builders"]
+#: Builders from `test_docs-{builder1,builder2}`
+SPHINX_BUILDERS = tuple(TOXENV_DOCS_BUILDERS[11:-1].split(","))
 
 
 def poetry_require_venv(session: Session) -> bool:
@@ -59,6 +127,66 @@ def poetry_require_venv(session: Session) -> bool:
     return isinstance(session.virtualenv, nox.sessions.PassthroughEnv) and not IN_CI
 
 
+class VenvLayout(NamedTuple):
+    """Paths of the venv nox is running in."""
+
+    path: Path
+    bin_dir: Path
+
+
+@functools.lru_cache(maxsize=None)
+def get_venv_layout() -> VenvLayout:
+    """Get the paths of the active venv; cached as they do not change during a run.
+
+    :raises FileNotFoundError: when no venv is active
+    """
+    venv_path = get_venv_path()
+    return VenvLayout(path=venv_path, bin_dir=get_venv_bin_dir(venv_path))
+
+
+@functools.lru_cache(maxsize=None)
+def get_venv_tmp() -> Path:
+    """Get the tmp dir of the active venv; it is only created when first needed.
+
+    :raises FileNotFoundError: when no venv is active
+    """
+    return get_venv_tmp_dir(get_venv_layout().path, create_if_missing=True)
+
+
+#: venv path -> args of the last `poetry install` run by this nox process
+LAST_POETRY_INSTALL: Dict[str, Tuple[str, bool, bool]] = {}
+
+
+def poetry_install(session: Session, extras: str, no_root: bool, no_dev: bool) -> None:
+    """Call ``session.poetry_install`` if the venv is not already set up like this.
+
+    Poetry uninstalls extras which are not requested, so only the last install per
+    venv is remembered.
+
+    :param session: nox session object
+    :param extras: extras to install separated by space
+    :param no_root: do not install the project itself
+    :param no_dev: do not install dev dependencies
+    """
+    venv_path = ""
+    with contextlib.suppress(FileNotFoundError):
+        venv_path = str(get_venv_layout().path)
+    install_args = (" ".join(sorted(extras.split())), no_root, no_dev)
+
+    if venv_path and LAST_POETRY_INSTALL.get(venv_path) == install_args:
+        session.log("Skipping install step; venv is already set up.")
+        return
+
+    session.poetry_install(
+        extras,
+        no_root=no_root,
+        no_dev=no_dev,
+        pip_require_venv=poetry_require_venv(session),
+    )
+    if venv_path:
+        LAST_POETRY_INSTALL[venv_path] = install_args
+
+
 #: -- TOX CALLING DECORATOR ------------------------------------------------------------
 def tox_caller(
     tox_target: Optional[str] = None, parametrized: bool = False
@@ -83,7 +211,7 @@ def tox_caller(
 
             in_venv = False
             with contextlib.suppress(FileNotFoundError):
-                in_venv = get_venv_path() is not None
+                in_venv = get_venv_layout().path is not None
 
             if not in_venv or "tox" in session.posargs:
                 posargs = [arg for arg in session.posargs if arg != "tox"]
@@ -113,28 +241,31 @@ def _tox_caller(
     if posargs is None:
         posargs = session.posargs
 
-    #: Extract tox args
-    tox_args: List[str] = []
+    #: Extract tox args and nox args for nox called by tox in one pass
+    tox_args_arg = ""
+    nox_args_arg = ""
     for arg in posargs:
-        if arg.startswith("TOX_ARGS="):
-            tox_args = arg[9:].split(",")
-            posargs.remove(arg)
-            break
+        if not tox_args_arg and arg.startswith("TOX_ARGS="):
+            tox_args_arg = arg
+        elif not nox_args_arg and arg.startswith("NOX_ARGS="):
+            nox_args_arg = arg
+
+    tox_args: List[str] = []
+    if tox_args_arg:
+        tox_args = tox_args_arg[9:].split(",")
+        posargs.remove(tox_args_arg)
 
-    #: Extract nox args for nox called by tox
     nox_args: List[str] = []
-    for arg in posargs:
-        if arg.startswith("NOX_ARGS="):
-            nox_args = arg[9:].split(",")
-            posargs.remove(arg)
-            break
+    if nox_args_arg:
+        nox_args = nox_args_arg[9:].split(",")
+        posargs.remove(nox_args_arg)
 
     if not find_spec("tox"):
-        session.poetry_install(
+        poetry_install(
+            session,
             "tox",
             no_root=True,
             no_dev=IN_CI,
-            pip_require_venv=poetry_require_venv(session),
         )
 
     session.env["_TOX_SKIP_SDIST"] = str(SKIP_INSTALL)
@@ -155,11 +286,11 @@ def package(session: Session) -> None:
     """Check sdist and wheel."""
     if "skip_install" not in session.posargs:
         extras = "poetry twine"
-        session.poetry_install(
+        poetry_install(
+            session,
             extras,
             no_root=True,
             no_dev=(TOX_CALLS or IN_CI),
-            pip_require_venv=poetry_require_venv(session),
         )
     else:
         session.log("Skipping install step.")
@@ -176,22 +307,18 @@ def test_code(session: Session) -> None:
     """Run tests with given python version."""
     if "skip_install" not in session.posargs:
         extras = "testing"
-        session.poetry_install(
+        poetry_install(
+            session,
             extras,
             no_root=(TOX_CALLS or SKIP_INSTALL),
             no_dev=(TOX_CALLS or IN_CI),
-            pip_require_venv=poetry_require_venv(session),
         )
     else:
         session.log("Skipping install step.")
         #: Remove processed posargs
-        with contextlib.suppress(ValueError):
-            session.posargs.remove("skip_install")
+        session.posargs.remove("skip_install")
 
-    interpreter = sys.implementation.__getattribute__("name")
-    version = ".".join([str(v) for v in sys.version_info[0:2]])
-    name = f"{OS}.{interpreter}{version}"
-    session.env["COVERAGE_FILE"] = str(COV_CACHE_DIR / f".coverage.{name}")
+    session.env["COVERAGE_FILE"] = str(COV_CACHE_DIR / f".coverage.{PYTHON_ID}")
 
     cov_source_dir = Path("no-spec-found")
     with contextlib.suppress(AttributeError, TypeError):
@@ -200,45 +327,46 @@ def test_code(session: Session) -> None:
         ).parent
 
     color = ["--color=yes"] if FORCE_COLOR else []
+    #: The pytest cache is not kept between CI runs
+    no_cache = ["-p", "no:cacheprovider"] if IN_CI else []
     posargs = session.posargs if session.posargs else ["tests"]
 
     session.run(
         "pytest",
         *color,
-        f"--basetemp={get_venv_tmp_dir(get_venv_path(), create_if_missing=True)}",
-        f"--junitxml={NOXFILE_DIR / '.junit_cache' / f'junit.{name}.xml'}",
+        *no_cache,
+        f"--basetemp={get_venv_tmp()}",
+        f"--junitxml={JUNIT_CACHE_DIR / f'junit.{PYTHON_ID}.xml'}",
         f"--cov={cov_source_dir}",
         f"--cov-fail-under={session.env.get('MIN_COVERAGE') or 100}",
         f"--numprocesses={session.env.get('PYTEST_XDIST_N') or 'auto'}",
+        "--dist=loadfile",
         *posargs,
     )
 
 
 def _coverage(session: Session, job: str) -> None:
     if "skip_install" not in session.posargs:
-        extras = "coverage"
+        extras = ["coverage"]
         if job in ("report", "all"):
-            extras += " diff-cover"
-        session.poetry_install(
-            extras,
+            extras.append("diff-cover")
+        poetry_install(
+            session,
+            " ".join(extras),
             no_root=True,
             no_dev=(TOX_CALLS or IN_CI),
-            pip_require_venv=poetry_require_venv(session),
         )
     else:
         session.log("Skipping install step.")
         #: Remove processed posargs
-        with contextlib.suppress(ValueError):
-            session.posargs.remove("skip_install")
+        session.posargs.remove("skip_install")
 
-    session.env["COVERAGE_FILE"] = str(COV_CACHE_DIR / ".coverage")
-    cov_xml_file = f"{COV_CACHE_DIR / 'coverage.xml'}"
-    cov_html_dir = f"{COV_CACHE_DIR / 'htmlcov'}"
+    session.env["COVERAGE_FILE"] = str(COV_DATA_FILE)
 
     if job in ("merge", "all"):
         session.run("coverage", "combine")
-        session.run("coverage", "xml", "-o", cov_xml_file)
-        session.run("coverage", "html", "-d", cov_html_dir)
+        session.run("coverage", "xml", "-o", str(COV_XML_FILE))
+        session.run("coverage", "html", "-d", str(COV_HTML_DIR))
 
     if job in ("report", "all"):
         raise_error = False
@@ -256,7 +384,7 @@ def _coverage(session: Session, job: str) -> None:
             "--ignore-unstaged",
             f"--fail-under={session.env.get('MIN_DIFF_COVERAGE') or 100}",
             f"--diff-range-notation={session.env.get('DIFF_RANGE_NOTATION') or '..'}",
-            cov_xml_file,
+            str(COV_XML_FILE),
         )
 
         if raise_error:
@@ -294,35 +422,50 @@ def safety(session: Session) -> None:
     """Check all dependencies for known vulnerabilities."""
     if "skip_install" not in session.posargs:
         extras = "poetry safety"
-        session.poetry_install(
+        poetry_install(
+            session,
             extras,
             no_root=True,
             no_dev=(TOX_CALLS or IN_CI),
-            pip_require_venv=poetry_require_venv(session),
         )
     else:
         session.log("Skipping install step.")
 
-    venv_path = get_venv_path()
-    req_file_path = (
-        get_venv_tmp_dir(venv_path, create_if_missing=True) / "requirements.txt"
-    )
+    req_file_path = get_venv_tmp() / "requirements.txt"
 
     #: Use `poetry show` to fill `requirements.txt`
-    command = [str(get_venv_bin_dir(venv_path) / "poetry"), "show"]
-    # TODO:#i# simplify when py36 is not longer supported.
-    if sys.version_info[0:2] > (3, 6):
-        cmd = subprocess.run(command, check=True, capture_output=True)  # noqa: S603
-    else:
-        cmd = subprocess.run(command, check=True, stdout=subprocess.PIPE)  # noqa: S603
-    with open(req_file_path, "w") as req_file:
-        req_file.write(
-            re.sub(r"([\w-]+)[ (!)]+([\d.a-z-]+).*", r"\1==\2", cmd.stdout.decode())
-        )
+    command = [str(get_venv_layout().bin_dir / "poetry"), "show"]
+    with subprocess.Popen(command, stdout=subprocess.PIPE) as cmd:  # noqa: S603
+        with open(req_file_path, "wb") as req_file:
+            for line in cmd.stdout:  # type: ignore[union-attr]
+                req_file.write(POETRY_SHOW_RE.sub(rb"\1==\2", line))
+    if cmd.returncode:
+        raise subprocess.CalledProcessError(cmd.returncode, command)
 
     session.run("safety", "check", "-r", str(req_file_path), "--full-report")
 
 
+def _skip_other_hooks(session: Session, hooks: List[str], skip: str) -> str:
+    """Get value for pre-commit's SKIP env var to only run the given hooks.
+
+    :param session: nox session object
+    :param hooks: ids of the hooks to run
+    :param skip: current value of the SKIP env var
+    :return: SKIP env var with all other hooks added
+    """
+    #: PyYAML is a dependency of pre-commit
+    import yaml  # noqa: C0415
+
+    pre_commit_config = yaml.safe_load(PRE_COMMIT_CONFIG.read_text())
+    all_hooks = {
+        hook["id"] for repo in pre_commit_config["repos"] for hook in repo["hooks"]
+    }
+    unknown_hooks = set(hooks) - all_hooks
+    if unknown_hooks:
+        session.error(f"Unknown pre-commit hooks: {sorted(unknown_hooks)}.")
+    return ",".join([*sorted(all_hooks - set(hooks)), skip])
+
+
 @nox.session
 @session_w_poetry
 @tox_caller()
@@ -330,11 +473,11 @@ def pre_commit(session: Session) -> None:  # noqa: R0912
     """Format and check the code."""
     if "skip_install" not in session.posargs:
         extras = "pre-commit testing docs poetry dev_nox"
-        session.poetry_install(
+        poetry_install(
+            session,
             extras,
             no_root=(TOX_CALLS or SKIP_INSTALL),
             no_dev=(TOX_CALLS or IN_CI),
-            pip_require_venv=poetry_require_venv(session),
         )
     else:
         session.log("Skipping install step.")
@@ -348,51 +491,59 @@ def pre_commit(session: Session) -> None:  # noqa: R0912
         show_diff = ["--show-diff-on-failure"]
         env = {}
 
-    #: Add SKIP from posargs to env
+    #: Get SKIP and HOOKS from posargs in one pass
     skip = ""
+    hooks_arg = ""
     for arg in session.posargs:
-        if arg.startswith("SKIP="):
+        if not skip and arg.startswith("SKIP="):
             skip = arg
-            break
+        elif not hooks_arg and arg.startswith("HOOKS="):
+            hooks_arg = arg
 
+    #: Add SKIP from posargs to env
     if skip:
         env = {"SKIP": f"{skip[5:]},{env.get('SKIP', '')}"}
 
-    #: Get hooks from posargs
-    hooks_arg = ""
-    for arg in session.posargs:
-        if arg.startswith("HOOKS="):
-            hooks_arg = arg
-            break
-
     #: Remove processed posargs
-    for arg in ("skip_install", "diff", "nodiff", skip, hooks_arg):
-        with contextlib.suppress(ValueError):
-            session.posargs.remove(arg)
+    processed_args = {"skip_install", "diff", "nodiff", skip, hooks_arg} - {""}
+    session.posargs[:] = [arg for arg in session.posargs if arg not in processed_args]
+
+    hooks = [hook for hook in hooks_arg[6:].split(",") if hook]
+    #: SKIP overshadows HOOKS, so do not start pre-commit just to skip everything
+    if hooks and set(hooks) <= set(env.get("SKIP", "").split(",")):
+        session.skip("All requested pre-commit hooks are skipped.")
 
-    hooks = hooks_arg[6:].split(",") if hooks_arg else [""]
+    hook_arg = []
+    if len(hooks) == 1:
+        hook_arg = hooks
+    elif hooks:
+        #: `pre-commit run` takes only one hook id, so skip all others instead
+        env = {"SKIP": _skip_other_hooks(session, hooks, env.get("SKIP", ""))}
 
     color = ["--color=always"] if FORCE_COLOR else []
 
-    error_hooks = []
-    for hook in hooks:
-        add_args = show_diff + session.posargs + ([hook] if hook else [])
-        try:
-            session.run("pre-commit", "run", *color, "--all-files", *add_args, env=env)
-        except CommandFailed:
-            error_hooks.append(hook)
+    failed = False
+    try:
+        session.run(
+            "pre-commit",
+            "run",
+            *color,
+            "--all-files",
+            *show_diff,
+            *session.posargs,
+            *hook_arg,
+            env=env,
+        )
+    except CommandFailed:
+        failed = True
 
     print(
         "HINT: to add checks as pre-commit hook run: ",
-        f'"{get_venv_bin_dir(get_venv_path()) / "pre-commit"} '
+        f'"{get_venv_layout().bin_dir / "pre-commit"} '
         "install -t pre-commit -t commit-msg.",
     )
 
-    if error_hooks:
-        if hooks != [""]:
-            nox_logger.error(
-                f"The following pre-commit hooks failed: {error_hooks}."  # noqa: G004
-            )
+    if failed:
         raise CommandFailed
 
 
@@ -401,39 +552,43 @@ def pre_commit(session: Session) -> None:  # noqa: R0912
 @tox_caller()
 def docs(session: Session) -> None:
     """Build docs with sphinx."""
-    extras = "docs"
+    extras = ["docs"]
     cmd = "sphinx-build"
-    args = ["-b", "html", "-aE", "docs/source", "docs/build/html"]
+    #: No `-j auto`: sphinx-autoapi is not parallel read safe, so sphinx reads serially
+    args = ["-b", "html", "-d", "docs/build/.doctrees"]
+    args += ["docs/source", "docs/build/html"]
+
+    #: Reuse sphinx's saved environment unless a clean build is requested
+    if "clean" in session.posargs:
+        args = ["-aE"] + args
 
     if "autobuild" in session.posargs or "ab" in session.posargs:
-        extras += " sphinx-autobuild"
+        extras.append("sphinx-autobuild")
         cmd = "sphinx-autobuild"
         args += ["--open-browser"]
 
     if "skip_install" not in session.posargs:
-        session.poetry_install(
-            extras,
+        poetry_install(
+            session,
+            " ".join(extras),
             no_root=(TOX_CALLS or SKIP_INSTALL),
             no_dev=(TOX_CALLS or IN_CI),
-            pip_require_venv=poetry_require_venv(session),
         )
     else:
         session.log("Skipping install step.")
 
     #: Remove processed posargs
-    for arg in ("skip_install", "autobuild", "ab"):
-        with contextlib.suppress(ValueError):
-            session.posargs.remove(arg)
+    processed_args = {"skip_install", "autobuild", "ab", "clean"}
+    session.posargs[:] = [arg for arg in session.posargs if arg not in processed_args]
 
     color = ["--color"] if FORCE_COLOR else []
 
     session.run(cmd, *color, *args, *session.posargs)
 
-    index_file = NOXFILE_DIR / "docs/build/html/index.html"
-    print(f"DOCUMENTATION AVAILABLE UNDER: {index_file.as_uri()}")
+    print(f"DOCUMENTATION AVAILABLE UNDER: {DOCS_INDEX_FILE.as_uri()}")
 
 
-@nox.parametrize("builder", TOXENV_DOCS_BUILDERS[11:-1].split(","))
+@nox.parametrize("builder", SPHINX_BUILDERS)
 @nox.session
 @session_w_poetry
 @tox_caller("test_docs-{builder}", parametrized=True)
@@ -441,20 +596,20 @@ def test_docs(session: Session, builder: str) -> None:
     """Build and check docs with (see env name) sphinx builder."""
     if "skip_install" not in session.posargs:
         extras = "docs"
-        session.poetry_install(
+        poetry_install(
+            session,
             extras,
             no_root=(TOX_CALLS or SKIP_INSTALL),
             no_dev=(TOX_CALLS or IN_CI),
-            pip_require_venv=poetry_require_venv(session),
         )
     else:
         session.log("Skipping install step.")
         #: Remove processed posargs
-        with contextlib.suppress(ValueError):
-            session.posargs.remove("skip_install")
+        session.posargs.remove("skip_install")
 
     source_dir = "docs/source"
     target_dir = f"docs/build/test/{builder}"
+    #: No `-j auto` like in `docs`; here `-W` would also turn the warning into a failure
     std_args = ["-aE", "-v", "-nW", "--keep-going", source_dir, target_dir]
 
     color = ["--color"] if FORCE_COLOR else []
@@ -472,15 +627,11 @@ def install_extras(session: Session) -> None:
     if not extras:
         session.skip("No extras found to be installed.")
 
-    extras_to_install = ""
-    for extra in extras:
-        extras_to_install += f" {extra}"
-
-    session.poetry_install(
-        extras_to_install.strip(),
+    poetry_install(
+        session,
+        " ".join(extras),
         no_root=True,
         no_dev=False,
-        pip_require_venv=poetry_require_venv(session),
     )
     session.run("python", "-m", "pip", "list", "--format=columns")
     print(f"PYTHON INTERPRETER LOCATION: {sys.executable}")
@@ -501,22 +652,18 @@ def setup_pre_commit(session: Session) -> None:
 @nox.session
 def create_spellignore(session: Session) -> None:  # noqa: W0613
     """Create .spellignore file (no overwrite)."""
-    gitignore_file_path = NOXFILE_DIR / ".gitignore"
-    with open(gitignore_file_path) as gitignore_file:
-        gitignore_content = gitignore_file.read()
-
     spellignore_file_path = NOXFILE_DIR / ".spellignore"
     if not spellignore_file_path.is_file():
-        with open(spellignore_file_path, "w") as spellignore_file:
-            spellignore_file.writelines(gitignore_content)
+        spellignore_file_path.write_text((NOXFILE_DIR / ".gitignore").read_text())
 
 
 @nox.session
 def dev(session: Session) -> None:
     """Call basic dev setup nox sessions."""
-    session.run(
-        "nox", "--session", "install_extras", "setup_pre_commit", "create_spellignore"
-    )
+    #: Call the sessions in-process instead of starting a new nox process
+    install_extras(session)
+    setup_pre_commit(session)
+    create_spellignore(session)
 
 
 #: -- TOX MULTI WRAPPER SESSIONS -------------------------------------------------------